@@ -16,16 +16,23 @@ Environment variable usage:
     $ export MAILER_PASSWORD=your-app-password
     >>> with Mailer() as mailer:
     ...     mailer.send(to='friend@example.com', subject='Hi', body='Hello!')
+
+Pooled usage (share logins across threads / jobs):
+    >>> pool = SMTPConnectionPool(max_connections=3)
+    >>> with Mailer(email='you@gmail.com', password='app-pass', pool=pool) as mailer:
+    ...     mailer.send_bulk(['a@x.com', 'b@x.com'], 'News', 'Hello!')
 """
 
 from .mailer import (
     Mailer,
+    BulkResult,
     MailerException,
     AuthError,
     ConnectError,
     SendError,
     ValidationError,
 )
+from .pool import SMTPConnectionPool
 
 __version__ = "1.0.9"
 __author__  = "rishabh"
@@ -34,9 +41,11 @@ __license__ = "MIT"
 
 __all__ = [
     "Mailer",
+    "BulkResult",
     "MailerException",
     "AuthError",
     "ConnectError",
     "SendError",
     "ValidationError",
+    "SMTPConnectionPool",
 ]
@@ -1,21 +1,341 @@
 import os
-import smtplib
+import re
+import base64
+import functools
+import itertools
 import logging
+import random
 import time
-from typing import Union, List, Optional
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Tuple, TypeVar, Union, List, Optional
+
+# smtplib, ssl and the email.mime machinery cost tens of milliseconds to
+# import, so they are imported where first needed rather than here.
+if TYPE_CHECKING:
+    import ssl
+    import smtplib
+    from email.charset import Charset
+    from email.mime.base import MIMEBase
+    from email.mime.text import MIMEText
+    from .pool import SMTPConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# max_messages: reconnect after this many messages on one connection, a
+# little below the point where the provider starts resetting it.
 PROVIDERS = {
-    "gmail":   {"host": "smtp.gmail.com",      "port": 587},
-    "outlook": {"host": "smtp.office365.com",  "port": 587},
-    "yahoo":   {"host": "smtp.mail.yahoo.com", "port": 587},
+    "gmail":   {"host": "smtp.gmail.com",      "port": 587, "max_messages": 4500},
+    "outlook": {"host": "smtp.office365.com",  "port": 587, "max_messages": 4500},
+    "yahoo":   {"host": "smtp.mail.yahoo.com", "port": 587, "max_messages": None},
 }
 
+# Attachments are read in multiples of 57 bytes so each chunk encodes to
+# whole 76-char base64 lines and the chunks can simply be concatenated.
+_ATTACHMENT_CHUNK = 57 * 1024
+
+# Upper bound, in seconds, on a single send_with_retry() wait.
+_MAX_BACKOFF = 60
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_EOL_RE = re.compile(r"\r\n|\n|\r")
+_LEADING_DOT_RE = re.compile(br"(?m)^\.")
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> "ssl.SSLContext":
+    """One shared TLS context, so the CA bundle is loaded once per process."""
+    import ssl
+    return ssl.create_default_context()
+
+
+@functools.lru_cache(maxsize=None)
+def _utf8_8bit() -> "Charset":
+    """UTF-8 with no body encoding, i.e. sent as 8bit — only valid on 8BITMIME servers."""
+    from email.charset import Charset
+    charset = Charset("utf-8")
+    charset.body_encoding = None
+    return charset
+
+
+# Any run of non-brace characters is a key, as with the old str.replace loop.
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_template(template: str) -> Callable[[dict], str]:
+    """
+    Split a {{key}} template once into literals and keys, returning a
+    single-pass renderer. Keys without a value are left as {{key}}.
+    """
+    parts    = _PLACEHOLDER_RE.split(template)
+    literals = parts[0::2]
+    keys     = parts[1::2]
+
+    def render(context: dict) -> str:
+        values = {str(key): val for key, val in context.items()}
+        out    = [literals[0]]
+        for key, literal in zip(keys, literals[1:]):
+            out.append(str(values[key]) if key in values else f"{{{{{key}}}}}")
+            out.append(literal)
+        return "".join(out)
+
+    return render
+
+
+def _refusal(code: int, resp: Union[str, bytes]) -> str:
+    """Format an SMTP reply for a recipient's error, e.g. '550 No such user'."""
+    return f"{code} {resp.decode('utf-8', 'replace') if isinstance(resp, bytes) else resp}"
+
+
+_T = TypeVar("_T")
+
+
+def _prefetch(items: Iterable[_T], depth: int = 2) -> Iterator[_T]:
+    """
+    Yield from `items`, produced ahead by a background thread through a
+    bounded queue, so building item i+1 overlaps the caller's work on item i.
+    Exceptions raised while producing are re-raised in the caller.
+    """
+    import queue
+    import threading
+
+    buffer = queue.Queue(maxsize=depth)
+    stop   = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        end = (False, None)
+        try:
+            for item in items:
+                if not put((True, item)):
+                    return
+        except BaseException as e:
+            end = (False, e)
+        finally:
+            # Always terminate the stream, or the caller blocks on get() forever.
+            put(end)
+
+    thread = threading.Thread(target=produce, name="mailer-sdk-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            ok, value = buffer.get()
+            if ok:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+
+def _fast_message_parts(
+    from_addr: str,
+    subject  : str,
+    body     : str,
+    html     : bool,
+    eight_bit: bool,
+) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Pre-render a single-part text message as raw bytes, split around the
+    To: value, so bulk sends only splice in the recipient and a Message-ID.
+    Returns None when the message needs the full MIME path instead.
+    """
+    from email.header import Header
+
+    payload = _EOL_RE.sub("\r\n", body)
+    if not payload.endswith("\r\n"):
+        payload += "\r\n"
+    payload = payload.encode("utf-8")
+    if any(len(line) > 998 for line in payload.split(b"\r\n")):
+        return None
+    if body.isascii():
+        cte = "7bit"
+    elif eight_bit:
+        cte = "8bit"
+    else:
+        return None
+    if not from_addr.isascii():
+        return None
+
+    if subject.isascii() and not _EOL_RE.search(subject) and len(subject) < 900:
+        encoded_subject = subject
+    else:
+        encoded_subject = Header(subject, "utf-8").encode(linesep="\r\n")
+
+    head = (
+        f"From: {from_addr}\r\n"
+        f"Subject: {encoded_subject}\r\n"
+        "MIME-Version: 1.0\r\n"
+        f'Content-Type: text/{"html" if html else "plain"}; charset="utf-8"\r\n'
+        f"Content-Transfer-Encoding: {cte}\r\n"
+        "To: "
+    ).encode("ascii")
+    return head, b"\r\n" + payload
+
+
+def _text_attachment_part(path: str, subtype: str, eight_bit: bool) -> Optional["MIMEText"]:
+    """
+    Attach a text file as-is (7bit, or 8bit when the server allows it) instead
+    of base64. Returns None if the file can't be sent unencoded.
+    """
+    from email.mime.text import MIMEText
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except UnicodeDecodeError:
+        return None
+    if any(len(line.encode("utf-8")) > 998 for line in text.splitlines()):
+        return None
+    if text.isascii():
+        return MIMEText(text, subtype)
+    if eight_bit:
+        return MIMEText(text, subtype, _utf8_8bit())
+    return None
+
+
+def _attachment_part(path: str, eight_bit: bool = False) -> "MIMEBase":
+    """Build an attachment part, base64-encoding binary files chunk by chunk."""
+    import mimetypes
+    from email.mime.base import MIMEBase
+
+    ctype, _ = mimetypes.guess_type(path)
+    if ctype and ctype.startswith("text/"):
+        part = _text_attachment_part(path, ctype.split("/")[1], eight_bit)
+        if part is not None:
+            return part
+
+    chunks = []
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_ATTACHMENT_CHUNK), b""):
+            chunks.append(base64.encodebytes(chunk).decode("ascii"))
+    if chunks:
+        chunks[-1] = chunks[-1].rstrip("\n")
+    # Strip before joining and drop the pieces right after, so the encoded
+    # file is only held twice at the peak, not three times.
+    payload = "".join(chunks)
+    del chunks
+    part = MIMEBase("application", "octet-stream")
+    part.set_payload(payload)
+    part["Content-Transfer-Encoding"] = "base64"
+    return part
+
+
+def _rset(conn: "smtplib.SMTP") -> None:
+    """RSET that ignores a dropped connection, as SMTP._rset does, so the
+    reply that ended the transaction is the error the caller sees."""
+    import smtplib
+    try:
+        conn.rset()
+    except smtplib.SMTPServerDisconnected:
+        pass
+
+
+def _is_international(sender: str, recipients: List[str]) -> bool:
+    return not (sender.isascii() and all(r.isascii() for r in recipients))
+
+
+def _validate_recipients(recipients: List[str]) -> None:
+    """Reject malformed addresses up front, before any SMTP work is done."""
+    bad = [r for r in recipients if not (isinstance(r, str) and _EMAIL_RE.fullmatch(r))]
+    if bad:
+        raise ValidationError(400,
+            f"{len(bad)} invalid recipient address(es), e.g. {bad[:5]}"
+        )
+
+
+class BulkResult(Mapping):
+    """
+    Outcome of a bulk send, stored column-wise: the recipient list, one
+    success byte per recipient and a sparse {index: error} map for failures,
+    instead of one dict per recipient. Reads like the usual
+    {'sent', 'failed', 'total', 'details'} dict; 'details' is built on access.
+
+    It is a read-only Mapping, not a dict — call to_dict() for a plain dict
+    (e.g. before json.dumps()).
+    """
+
+    _KEYS = ("sent", "failed", "total", "details")
+
+    def __init__(self, recipients: List[str], success: bytearray, errors: Dict[int, str]):
+        self.recipients = recipients
+        self.success    = success
+        self.errors     = errors
+        self._sent      = success.count(1)
+
+    @classmethod
+    def concat(cls, parts: List["BulkResult"]) -> "BulkResult":
+        recipients, errors, offset = [], {}, 0
+        for part in parts:
+            recipients.extend(part.recipients)
+            errors.update((offset + i, e) for i, e in part.errors.items())
+            offset += len(part.recipients)
+        return cls(recipients, bytearray().join(p.success for p in parts), errors)
+
+    @classmethod
+    def all_failed(cls, recipients: List[str], error: str) -> "BulkResult":
+        return cls(recipients, bytearray(len(recipients)), dict.fromkeys(range(len(recipients)), error))
+
+    def __getitem__(self, key: str):
+        if key == "sent":
+            return self._sent
+        if key == "failed":
+            return len(self.recipients) - self._sent
+        if key == "total":
+            return len(self.recipients)
+        if key == "details":
+            return [
+                {"to": r, "success": True} if ok else {"to": r, "success": False, "error": self.errors.get(i)}
+                for i, (r, ok) in enumerate(zip(self.recipients, self.success))
+            ]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def to_dict(self) -> dict:
+        """Materialize the result as a plain dict, 'details' included."""
+        return {key: self[key] for key in self._KEYS}
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        fields = (f"{k!r}: {self[k]!r}" for k in self._KEYS if k != "details")
+        return "{" + ", ".join(fields) + ", 'details': [...]}"
+
+
+class _BatchedResult(BulkResult):
+    """BulkResult that also reports how many SMTP transactions were used."""
+
+    _KEYS = BulkResult._KEYS + ("batches",)
+
+    def __init__(self, recipients: List[str], success: bytearray, errors: Dict[int, str], batches: int):
+        self.batches = batches
+        super().__init__(recipients, success, errors)
+
+    def __getitem__(self, key: str):
+        if key == "batches":
+            return self.batches
+        return super().__getitem__(key)
+
+
+def _log_bulk(result: BulkResult) -> BulkResult:
+    logger.info("Bulk send complete: %d/%d sent", result["sent"], result["total"])
+    return result
+
+
 class MailerException(Exception):
     def __init__(self, code: int, message: str):
         self.code    = code
@@ -37,6 +357,13 @@ class Mailer:
         password (str): App password. Falls back to MAILER_PASSWORD env var.
         provider (str): Email provider — 'gmail', 'outlook', 'yahoo'. Default: 'gmail'.
         timeout  (int): SMTP connection timeout in seconds. Default: 10.
+        pool     (SMTPConnectionPool): Optional shared connection pool. When set,
+                  connect() leases a connection and disconnect() returns it.
+        max_messages_per_connection (int): Reconnect after this many messages on
+                  one connection, before the provider resets it. 0 disables.
+                  With a pool, counts span leases and the pool's max_messages
+                  also applies, whichever is lower.
+                  Default: the provider's limit (4500 for Gmail and Outlook).
 
     Example:
         >>> from mailer_sdk import Mailer
@@ -52,12 +379,17 @@ class Mailer:
         password: Optional[str] = None,
         provider: str = "gmail",
         timeout : int = 10,
+        pool    : Optional["SMTPConnectionPool"] = None,
+        max_messages_per_connection: Optional[int] = None,
     ):
         self.email    = email    or os.environ.get("MAILER_EMAIL")
         self.password = password or os.environ.get("MAILER_PASSWORD")
         self.provider = provider or os.environ.get("MAILER_PROVIDER", "gmail")
         self.timeout  = timeout
+        self.pool     = pool
         self._conn    = None
+        self._msg_count   = 0
+        self._lease_start = 0
 
         if not self.email or not self.password:
             raise ValidationError(400,
@@ -74,16 +406,50 @@ class Mailer:
 
         self.host = cfg["host"]
         self.port = cfg["port"]
+        self.max_messages_per_connection = (
+            cfg["max_messages"] if max_messages_per_connection is None
+            else max_messages_per_connection
+        )
 
     def connect(self) -> "Mailer":
         if self._conn:
             return self
+        if self.pool is None:
+            self._conn = self._open()
+            self._msg_count = self._lease_start = 0
+            return self
+        while True:
+            self._conn = self.pool.acquire(self._pool_key, self._open, timeout=self.timeout)
+            # Count from the connection's whole life, not just this lease.
+            self._msg_count = self._lease_start = self.pool.messages_sent(self._conn)
+            cap = self._message_cap
+            if not cap or self._msg_count < cap:
+                return self
+            # Returned by a Mailer with a higher cap than ours — retire it.
+            self.disconnect()
+
+    @property
+    def _message_cap(self) -> Optional[int]:
+        """The lower of our own and the pool's per-connection limits; None if neither is set."""
+        caps = [self.max_messages_per_connection, self.pool and self.pool.max_messages]
+        caps = [cap for cap in caps if cap]
+        return min(caps) if caps else None
+
+    @property
+    def _pool_key(self) -> tuple:
+        return (self.host, self.port, self.email)
+
+    def _open(self) -> "smtplib.SMTP":
+        import socket
+        import smtplib
         try:
             logger.info("Connecting to %s:%s ...", self.host, self.port)
-            self._conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
-            self._conn.ehlo()
-            self._conn.starttls()
-            self._conn.login(self.email, self.password)
+            conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            # SMTP is a chatty request/reply protocol — don't let Nagle hold back short commands.
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.ehlo()
+            conn.starttls(context=_ssl_context())
+            conn.login(self.email, self.password)
             logger.info("Connected and authenticated: %s", self.host)
         except smtplib.SMTPAuthenticationError as e:
             raise AuthError(535, f"Authentication failed. Check your App Password. Detail: {e}")
@@ -91,10 +457,17 @@ class Mailer:
             raise ConnectError(500, f"Could not connect to {self.host}:{self.port}. Detail: {e}")
         except Exception as e:
             raise ConnectError(500, str(e))
-        return self
+        return conn
 
     def disconnect(self) -> None:
-        if self._conn:
+        if self._conn and self.pool is not None:
+            cap = self._message_cap
+            self.pool.release(
+                self._pool_key, self._conn, self._msg_count - self._lease_start,
+                retire=bool(cap) and self._msg_count >= cap,
+            )
+            self._conn = None
+        elif self._conn:
             try:
                 self._conn.quit()
                 logger.info("Disconnected from %s", self.host)
@@ -103,6 +476,18 @@ class Mailer:
             finally:
                 self._conn = None
 
+    def _ensure_alive(self) -> None:
+        """Reconnect if the server has silently dropped an idle session."""
+        import smtplib
+        try:
+            alive = self._conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            alive = False
+        if not alive:
+            logger.info("Session to %s is stale, reconnecting ...", self.host)
+            self.disconnect()
+            self.connect()
+
     def send(
         self,
         to         : Union[str, List[str]],
@@ -113,25 +498,47 @@ class Mailer:
         bcc        : Optional[List[str]] = None,
         attachments: Optional[List[str]] = None,
     ) -> dict:
+        recipients, data = self._build_message(to, subject, body, html, cc, bcc, attachments)
+        return self._transmit(recipients, data)
+
+    def _build_message(
+        self,
+        to         : Union[str, List[str]],
+        subject    : str,
+        body       : str,
+        html       : bool = False,
+        cc         : Optional[List[str]] = None,
+        bcc        : Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None,
+        eight_bit  : Optional[bool] = None,
+    ) -> Tuple[List[str], bytes]:
+        """
+        Build and serialize a message once; returns (envelope recipients, data).
+        `eight_bit` defaults to what the current connection advertises; pass it
+        explicitly when building off the thread that owns the connection.
+        """
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.policy import SMTP, SMTPUTF8
+
         if not to:
             raise ValidationError(400, "'to' address is required.")
 
         try:
-            msg            = MIMEMultipart()
+            msg            = MIMEMultipart(policy=SMTP)
             msg["From"]    = self.email
             msg["To"]      = ", ".join(to) if isinstance(to, list) else to
             msg["Subject"] = subject
             if cc:  msg["Cc"]  = ", ".join(cc)
-            if bcc: msg["Bcc"] = ", ".join(bcc)
+            # Bcc goes on the envelope only — never in the headers (as send_message does).
 
             msg.attach(MIMEText(body, "html" if html else "plain"))
 
+            if eight_bit is None:
+                eight_bit = self._conn is not None and "8bitmime" in self._conn.esmtp_features
             for path in (attachments or []):
-                with open(path, "rb") as f:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(f.read())
-                encoders.encode_base64(part)
-                filename = path.split("/")[-1]
+                part = _attachment_part(path, eight_bit)
+                filename = os.path.basename(path)
                 part.add_header("Content-Disposition", f"attachment; filename={filename}")
                 msg.attach(part)
 
@@ -139,17 +546,27 @@ class Mailer:
                 (to if isinstance(to, list) else [to]) +
                 (cc or []) + (bcc or [])
             )
+            # Serialize straight to CRLF bytes with BytesGenerator, like
+            # SMTP.send_message(), but once so retries can resend the same bytes.
+            if _is_international(self.email, recipients):
+                return recipients, msg.as_bytes(policy=SMTPUTF8)
+            return recipients, msg.as_bytes()
 
-            self._conn.sendmail(self.email, recipients, msg.as_string())
-            logger.info("Email sent to: %s", recipients)
-            return {"success": True, "to": recipients}
+        except Exception as e:
+            logger.error("Send failed: %s", str(e))
+            raise SendError(500, str(e))
 
+    def _transmit(self, recipients: List[str], data: bytes) -> dict:
+        try:
+            self._sendmail(recipients, data)
+            self._sent_one()
         except MailerException:
             raise
-
         except Exception as e:
             logger.error("Send failed: %s", str(e))
             raise SendError(500, str(e))
+        logger.info("Email sent to: %s", recipients)
+        return {"success": True, "to": recipients}
 
     def send_html(
         self,
@@ -173,46 +590,429 @@ class Mailer:
         """
         return self.send(to, subject, body, html=True)
 
+    def _send_each(
+        self,
+        recipients: List[str],
+        subject   : str,
+        bodies    : Iterable[str],
+        html      : bool,
+    ) -> "BulkResult":
+        """Send one message per recipient over a single session, pairing each with its body."""
+        import smtplib
+        from email.utils import make_msgid
+
+        if not recipients:
+            return BulkResult([], bytearray(), {})
+        self.connect()
+        self._ensure_alive()
+
+        eight_bit = "8bitmime" in self._conn.esmtp_features
+        domain    = self.email.rpartition("@")[2]
+
+        def build() -> Iterator[Tuple[int, str, Union[bytes, Exception]]]:
+            last_body = parts = None
+            body_iter = iter(bodies)
+            for i, recipient in enumerate(recipients):
+                try:
+                    # Pulled inside the try so a failed render (e.g. a bad
+                    # template context) fails this recipient, not the job.
+                    body = next(body_iter)
+                    if body is not last_body:
+                        last_body = body
+                        parts = _fast_message_parts(self.email, subject, body, html, eight_bit)
+                    if parts and recipient.isascii() and not _EOL_RE.search(recipient):
+                        head, tail = parts
+                        data = b"".join((
+                            head, recipient.encode("ascii"),
+                            b"\r\nMessage-ID: ", make_msgid(domain=domain).encode("ascii"),
+                            b"\r\n", tail,
+                        ))
+                    else:
+                        # Runs on the prefetch thread: never read self._conn here.
+                        data = self._build_message(recipient, subject, body, html, eight_bit=eight_bit)[1]
+                except Exception as e:
+                    data = e
+                yield i, recipient, data
+
+        success = bytearray(len(recipients))
+        errors  = {}
+        # Messages are built on a background thread while the previous one is on the wire.
+        for i, recipient, data in _prefetch(build()):
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                try:
+                    self._sendmail([recipient], data)
+                except smtplib.SMTPServerDisconnected:
+                    # Server dropped us mid-job — reconnect once and retry.
+                    self.disconnect()
+                    self.connect()
+                    self._sendmail([recipient], data)
+                self._sent_one()
+                success[i] = 1
+            except smtplib.SMTPRecipientsRefused as e:
+                errors[i] = _refusal(*e.recipients[recipient])
+                logger.warning("Bulk send failed for %s: %s", recipient, errors[i])
+            except MailerException as e:
+                errors[i] = e.message
+                logger.warning("Bulk send failed for %s: %s", recipient, e.message)
+            except Exception as e:
+                errors[i] = str(e)
+                logger.warning("Bulk send failed for %s: %s", recipient, str(e))
+
+        return BulkResult(recipients, success, errors)
+
+    def _sent_one(self) -> None:
+        self._msg_count += 1
+        cap = self._message_cap
+        if cap and self._msg_count >= cap:
+            # Hang up before the provider does; the next send reconnects.
+            logger.info("Sent %d messages on this connection, reconnecting ...", self._msg_count)
+            self.disconnect()
+
+    def _sendmail(self, rcpts: List[str], data: Union[str, bytes]) -> dict:
+        if self._conn is None:
+            self.connect()
+        # 8bit content has to be declared on MAIL FROM (RFC 6152), and
+        # non-ASCII addresses need SMTPUTF8 (RFC 6531).
+        options = ["BODY=8BITMIME"] if isinstance(data, bytes) and not data.isascii() else []
+        if _is_international(self.email, rcpts):
+            options.append("SMTPUTF8")
+        if "pipelining" in self._conn.esmtp_features:
+            return self._pipeline_send(rcpts, data, options)
+        return self._conn.sendmail(self.email, rcpts, data, options)
+
+    def _pipeline_send(
+        self,
+        rcpts       : List[str],
+        data        : Union[str, bytes],
+        mail_options: Iterable[str] = (),
+    ) -> dict:
+        """
+        sendmail() for servers advertising PIPELINING (RFC 2920): MAIL FROM,
+        every RCPT TO and DATA go out in one write and their replies are read
+        back together, so a message costs two round trips instead of 3 + len(rcpts).
+        Raises the same smtplib exceptions as sendmail().
+        """
+        import smtplib
+
+        conn = self._conn
+        if isinstance(data, str):
+            data = _EOL_RE.sub("\r\n", data).encode("ascii")
+        mail_options = list(mail_options)
+        if "size" in conn.esmtp_features:
+            # Lets the server refuse an oversized message before we upload it.
+            mail_options.append(f"SIZE={len(data)}")
+        if "SMTPUTF8" in mail_options:
+            if "smtputf8" not in conn.esmtp_features:
+                raise smtplib.SMTPNotSupportedError("SMTPUTF8 not supported by server")
+            conn.command_encoding = "utf-8"
+        commands = [" ".join([f"MAIL FROM:{smtplib.quoteaddr(self.email)}", *mail_options])]
+        commands += [f"RCPT TO:{smtplib.quoteaddr(r)}" for r in rcpts]
+        commands.append("DATA")
+        conn.send("".join(c + "\r\n" for c in commands))
+
+        # A 421 means the server is closing the channel: like sendmail(),
+        # close our end and stop reading replies that will never come.
+        mail_code, mail_resp = conn.getreply()
+        if mail_code == 421:
+            conn.close()
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, self.email)
+        refused = {}
+        for r in rcpts:
+            code, resp = conn.getreply()
+            if code not in (250, 251):
+                refused[r] = (code, resp)
+            if code == 421:
+                conn.close()
+                raise smtplib.SMTPRecipientsRefused(refused)
+        data_code, data_resp = conn.getreply()
+        if data_code == 421:
+            conn.close()
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        if mail_code != 250 or len(refused) == len(rcpts) or data_code != 354:
+            if data_code == 354:
+                # DATA was accepted with nothing to deliver — end it empty.
+                try:
+                    conn.send(".\r\n")
+                    conn.getreply()
+                except smtplib.SMTPServerDisconnected:
+                    pass
+            _rset(conn)
+            if mail_code != 250:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp, self.email)
+            if len(refused) == len(rcpts):
+                raise smtplib.SMTPRecipientsRefused(refused)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        payload = _LEADING_DOT_RE.sub(b"..", data)
+        if not payload.endswith(b"\r\n"):
+            payload += b"\r\n"
+        conn.send(payload + b".\r\n")
+        code, resp = conn.getreply()
+        if code != 250:
+            if code == 421:
+                conn.close()
+            else:
+                _rset(conn)
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
     def send_bulk(
         self,
         recipients: List[str],
         subject   : str,
         body      : str,
         html      : bool = False,
-    ) -> dict:
+        mode      : str  = "individual",
+        max_workers: int = 1,
+    ) -> BulkResult:
         """
-        Send the same email individually to multiple recipients.
+        Send the same email to multiple recipients.
+
+        Every message goes out over one authenticated SMTP session. Reuse a
+        single Mailer for the whole job — creating a new Mailer per recipient
+        pays a full EHLO/STARTTLS/LOGIN each time, which providers throttle
+        (e.g. Gmail's "454 Too many login attempts").
 
         Args:
             recipients (list): List of email addresses.
             subject    (str):  Subject line.
             body       (str):  Email body.
             html       (bool): Set True if body is HTML. Default: False.
+            mode       (str):  'individual' sends one message per recipient.
+                               'bcc' sends a single message with every recipient
+                               on the envelope only (no personalisation, one DATA).
+                               Default: 'individual'.
+            max_workers (int): Parallel SMTP sessions for 'individual' mode.
+                               Values above 1 need a Mailer created with
+                               pool=SMTPConnectionPool(...) and are capped at
+                               its max_connections. Default: 1.
 
         Returns:
-            dict: {'sent': 2, 'failed': 1, 'total': 3, 'details': [...]}
+            BulkResult: {'sent': 2, 'failed': 1, 'total': 3, 'details': [...]}
 
         Example:
             >>> mailer.send_bulk(['a@x.com', 'b@x.com'], 'News', 'Hello!')
+            >>> mailer.send_bulk(['a@x.com', 'b@x.com'], 'News', 'Hello!', mode='bcc')
+        """
+        _validate_recipients(recipients)
+        if mode not in ("individual", "bcc"):
+            raise ValidationError(400, f"Unknown mode '{mode}'. Supported: ['individual', 'bcc']")
+        if mode == "bcc":
+            result = self._send_bcc(recipients, subject, body, html)
+        elif max_workers > 1:
+            result = self._send_parallel(recipients, subject, body, html, max_workers)
+        else:
+            result = self._send_each(recipients, subject, itertools.repeat(body), html)
+        return _log_bulk(result)
+
+    def _send_parallel(
+        self,
+        recipients : List[str],
+        subject    : str,
+        body       : str,
+        html       : bool,
+        max_workers: int,
+    ) -> "BulkResult":
+        """
+        Split recipients into contiguous chunks and send each chunk from its own
+        thread on its own pooled connection (smtplib.SMTP is not thread-safe).
         """
-        results = []
-        for recipient in recipients:
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self.pool is None:
+            raise ValidationError(400,
+                "max_workers > 1 requires a Mailer created with pool=SMTPConnectionPool(...)."
+            )
+        if not recipients:
+            return BulkResult([], bytearray(), {})
+        # Hand our own lease back so a worker can reuse it.
+        self.disconnect()
+
+        workers = max(1, min(max_workers, self.pool.max_connections, len(recipients)))
+        size    = -(-len(recipients) // workers)
+        chunks  = [recipients[i:i + size] for i in range(0, len(recipients), size)]
+
+        def run(chunk: List[str]) -> BulkResult:
+            worker = Mailer(
+                self.email, self.password, self.provider, self.timeout,
+                pool=self.pool, max_messages_per_connection=self.max_messages_per_connection,
+            )
             try:
-                result = self.send(to=recipient, subject=subject, body=body, html=html)
-                results.append({"to": recipient, "success": True})
+                return worker._send_each(chunk, subject, itertools.repeat(body), html)
             except MailerException as e:
-                results.append({"to": recipient, "success": False, "error": e.message})
-                logger.warning("Bulk send failed for %s: %s", recipient, e.message)
+                logger.warning("Bulk worker failed: %s", e.message)
+                return BulkResult.all_failed(chunk, e.message)
+            finally:
+                worker.disconnect()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return BulkResult.concat(list(executor.map(run, chunks)))
+
+    def _send_bcc(
+        self,
+        recipients: List[str],
+        subject   : str,
+        body      : str,
+        html      : bool,
+    ) -> "BulkResult":
+        """
+        Send one message with all recipients on the envelope. Recipients the
+        server defers with a 4xx (e.g. 452 too many recipients) are retried
+        individually; permanent 5xx refusals are recorded as failures.
+        """
+        import smtplib
+
+        self.connect()
+        self._ensure_alive()
+
+        try:
+            data    = self._build_broadcast(subject, body, html)
+            refused = self._sendmail(recipients, data)
+            self._sent_one()
+        except smtplib.SMTPRecipientsRefused as e:
+            refused = e.recipients
+        except Exception as e:
+            logger.warning("Bulk BCC send failed: %s", str(e))
+            return BulkResult.all_failed(recipients, str(e))
+
+        success = bytearray(b"\x01") * len(recipients)
+        errors  = {}
+        positions = []
+        for i, recipient in enumerate(recipients):
+            if recipient not in refused:
+                continue
+            code, resp = refused[recipient]
+            if 400 <= code < 500:
+                positions.append(i)
+            else:
+                success[i] = 0
+                errors[i]  = _refusal(code, resp)
+        if positions:
+            logger.info("%d recipient(s) deferred in BCC batch, sending individually", len(positions))
+            retry = self._send_each([recipients[i] for i in positions], subject, itertools.repeat(body), html)
+            for j, i in enumerate(positions):
+                success[i] = retry.success[j]
+                if j in retry.errors:
+                    errors[i] = retry.errors[j]
+
+        return BulkResult(recipients, success, errors)
+
+    def _build_broadcast(self, subject: str, body: str, html: bool) -> bytes:
+        """Serialize one message meant for many envelope recipients (none named in the headers)."""
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.policy import SMTP
 
-        sent   = sum(1 for r in results if r["success"])
-        failed = len(results) - sent
-        logger.info("Bulk send complete: %d/%d sent", sent, len(recipients))
-        return {
-            "sent"   : sent,
-            "failed" : failed,
-            "total"  : len(recipients),
-            "details": results,
-        }
+        msg            = MIMEMultipart(policy=SMTP)
+        msg["From"]    = self.email
+        msg["To"]      = "undisclosed-recipients:;"
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body, "html" if html else "plain"))
+        return msg.as_bytes()
+
+    def send_bulk_batched(
+        self,
+        recipients: List[str],
+        subject   : str,
+        body      : str,
+        html      : bool = False,
+        batch_size: int  = 20,
+    ) -> BulkResult:
+        """
+        Send the same email to multiple recipients, `batch_size` recipients per
+        SMTP transaction. Recipients are on the envelope only, never in the headers.
+
+        Addresses refused at RCPT are reported individually. Those deferred
+        with a 4xx (e.g. 452 too many recipients) are sent again in follow-up
+        batches. If the server rejects the message itself at DATA (e.g. 552
+        too large, 554 content), the whole batch is recorded as failed with
+        that reply.
+
+        Args:
+            recipients (list): List of email addresses.
+            subject    (str):  Subject line.
+            body       (str):  Email body.
+            html       (bool): Set True if body is HTML. Default: False.
+            batch_size (int):  Recipients per transaction. Default: 20.
+
+        Returns:
+            BulkResult: {'sent': 40, 'failed': 1, 'total': 41, 'batches': 3, 'details': [...]}
+
+        Example:
+            >>> mailer.send_bulk_batched(subscribers, 'News', 'Hello!', batch_size=50)
+        """
+        import smtplib
+
+        _validate_recipients(recipients)
+        if batch_size < 1:
+            raise ValidationError(400, "batch_size must be at least 1.")
+        if not recipients:
+            return _log_bulk(_BatchedResult([], bytearray(), {}, 0))
+
+        self.connect()
+        self._ensure_alive()
+
+        data    = self._build_broadcast(subject, body, html)
+        success = bytearray(len(recipients))
+        errors  = {}
+
+        def send(batch: List[int]) -> List[int]:
+            """One transaction to the recipients at `batch`; returns those deferred with a 4xx."""
+            chunk = [recipients[i] for i in batch]
+            try:
+                try:
+                    refused = self._sendmail(chunk, data)
+                except smtplib.SMTPServerDisconnected:
+                    self.disconnect()
+                    self.connect()
+                    refused = self._sendmail(chunk, data)
+                self._sent_one()
+            except smtplib.SMTPRecipientsRefused as e:
+                refused = e.recipients
+            except smtplib.SMTPDataError as e:
+                # DATA replies are about the message (size, content), not an
+                # address — resending to fewer recipients would not help.
+                logger.warning("Batch rejected at DATA: %s", _refusal(e.smtp_code, e.smtp_error))
+                errors.update(dict.fromkeys(batch, _refusal(e.smtp_code, e.smtp_error)))
+                return []
+            except MailerException as e:
+                errors.update(dict.fromkeys(batch, e.message))
+                return []
+            except Exception as e:
+                logger.warning("Batch send failed: %s", str(e))
+                errors.update(dict.fromkeys(batch, str(e)))
+                return []
+
+            deferred = []
+            for i in batch:
+                if recipients[i] in refused:
+                    code, resp = refused[recipients[i]]
+                    errors[i] = _refusal(code, resp)
+                    if 400 <= code < 500:
+                        deferred.append(i)
+                else:
+                    success[i] = 1
+                    errors.pop(i, None)
+            return deferred
+
+        # Recipients deferred with a 4xx (e.g. 452 too many recipients) go out
+        # in follow-up batches, for as long as each round delivers something.
+        pending = list(range(len(recipients)))
+        batches = 0
+        while pending:
+            deferred = []
+            for lo in range(0, len(pending), batch_size):
+                deferred += send(pending[lo:lo + batch_size])
+                batches  += 1
+            if len(deferred) == len(pending):
+                break
+            if deferred:
+                logger.info("%d recipient(s) deferred, sending a follow-up round", len(deferred))
+            pending = deferred
+        return _log_bulk(_BatchedResult(recipients, success, errors, batches))
 
     def send_template(
         self,
@@ -241,10 +1041,42 @@ class Mailer:
             ...     context={'name': 'Alice', 'id': '1042'}
             ... )
         """
-        body = template
-        for key, val in context.items():
-            body = body.replace(f"{{{{{key}}}}}", str(val))
-        return self.send_html(to, subject, body)
+        return self.send_html(to, subject, _compile_template(template)(context))
+
+    def send_bulk_template(
+        self,
+        recipients: List[str],
+        subject   : str,
+        template  : str,
+        contexts  : List[dict],
+    ) -> BulkResult:
+        """
+        Send a personalised HTML template individually to multiple recipients.
+
+        The template is compiled once and rendered per recipient.
+
+        Args:
+            recipients (list): List of email addresses.
+            subject    (str):  Subject line.
+            template   (str):  HTML string with {{key}} placeholders.
+            contexts   (list): One context dict per recipient, in the same order.
+
+        Returns:
+            BulkResult: {'sent': 2, 'failed': 1, 'total': 3, 'details': [...]}
+
+        Example:
+            >>> mailer.send_bulk_template(
+            ...     ['a@x.com', 'b@x.com'], 'Welcome', '<h1>Hi {{name}}!</h1>',
+            ...     [{'name': 'Alice'}, {'name': 'Bob'}]
+            ... )
+        """
+        _validate_recipients(recipients)
+        if len(contexts) != len(recipients):
+            raise ValidationError(400,
+                f"Got {len(contexts)} contexts for {len(recipients)} recipients."
+            )
+        render = _compile_template(template)
+        return _log_bulk(self._send_each(recipients, subject, map(render, contexts), html=True))
 
     def send_with_retry(
         self,
@@ -254,17 +1086,25 @@ class Mailer:
         html       : bool = False,
         max_retries: int  = 3,
         backoff    : int  = 1,
+        total_budget: Optional[float] = None,
     ) -> dict:
         """
         Send an email with automatic retry on failure.
 
+        Waits between attempts use "full jitter" — a random delay up to the
+        exponential backoff cap — so many clients retrying after the same
+        provider outage don't reconnect in lockstep.
+
         Args:
             to          (str | list): Recipient address(es).
             subject     (str):        Subject line.
             body        (str):        Email body.
             html        (bool):       Set True if body is HTML. Default: False.
             max_retries (int):        Maximum retry attempts. Default: 3.
-            backoff     (int):        Base backoff seconds (doubles each attempt). Default: 1.
+            backoff     (int):        Base backoff seconds; the wait before attempt n is
+                                      random in [0, min(60, backoff * 2**n)]. Default: 1.
+            total_budget (float):     Max seconds to spend retrying, measured on a
+                                      monotonic clock. Default: None (no limit).
 
         Returns:
             dict: {'success': True, 'to': [...]}
@@ -273,20 +1113,41 @@ class Mailer:
         Example:
             >>> mailer.send_with_retry(to='x@x.com', subject='Hi', body='Hello!')
         """
+        # The message is identical on every attempt — build it once.
+        recipients, data = self._build_message(to, subject, body, html)
+
+        deadline   = None if total_budget is None else time.monotonic() + total_budget
         last_error = None
+
+        def budget_exhausted(attempts: int) -> dict:
+            return {"success": False, "error":
+                f"Retry budget ({total_budget}s) exhausted after {attempts} attempt(s). "
+                f"Last error: {last_error.message}"}
+
         for attempt in range(max_retries):
             try:
-                return self.send(to, subject, body, html=html)
+                return self._transmit(recipients, data)
             except AuthError:
                 raise
             except SendError as e:
                 last_error = e
-                wait = backoff * (2 ** attempt)
-                logger.warning(
-                    "Attempt %d/%d failed. Retrying in %ds... (%s)",
-                    attempt + 1, max_retries, wait, e.message
-                )
-                time.sleep(wait)
+            if attempt + 1 == max_retries:
+                break
+
+            wait = random.uniform(0, min(_MAX_BACKOFF, backoff * (2 ** attempt)))
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return budget_exhausted(attempt + 1)
+                wait = min(wait, remaining)
+            logger.warning(
+                "Attempt %d/%d failed. Retrying in %.1fs... (%s)",
+                attempt + 1, max_retries, wait, last_error.message
+            )
+            time.sleep(wait)
+            # A wait clipped to the deadline ends on it — don't start another attempt.
+            if deadline is not None and time.monotonic() >= deadline:
+                return budget_exhausted(attempt + 1)
 
         error_msg = last_error.message if last_error else "Unknown error"
         return {"success": False, "error": f"Max retries ({max_retries}) exceeded. Last error: {error_msg}"}
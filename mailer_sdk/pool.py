@@ -0,0 +1,161 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Hashable, Optional
+
+from .mailer import ConnectError
+
+if TYPE_CHECKING:
+    import smtplib
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConnectionPool:
+    """
+    A thread-safe pool of authenticated SMTP connections.
+
+    Connections are keyed by (host, port, email), so Mailers sharing a pool
+    and an account reuse each other's logins instead of paying a fresh
+    EHLO/STARTTLS/LOGIN per job.
+
+    Args:
+        max_connections (int): Max open connections per key. Default: 5.
+        max_messages    (int): Messages sent on a connection before it is
+                               retired. Default: 4500.
+
+    Example:
+        >>> from mailer_sdk import Mailer, SMTPConnectionPool
+        >>> pool = SMTPConnectionPool(max_connections=3)
+        >>> with Mailer(email='you@gmail.com', password='app-pass', pool=pool) as mailer:
+        ...     mailer.send(to='friend@example.com', subject='Hi', body='Hello!')
+        >>> pool.close()
+    """
+
+    def __init__(self, max_connections: int = 5, max_messages: int = 4500):
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.max_connections = max_connections
+        self.max_messages    = max_messages
+        # Guards everything below; notified whenever a connection is returned
+        # or a slot frees up, so blocked acquire() calls can retry.
+        self._cond   = threading.Condition()
+        self._idle   : Dict[Hashable, "Deque[smtplib.SMTP]"] = {}
+        self._open   : Dict[Hashable, int] = {}
+        self._counts : Dict[int, int] = {}
+
+    def _forget(self, key: Hashable, conn: "smtplib.SMTP") -> None:
+        with self._cond:
+            self._open[key] -= 1
+            self._counts.pop(id(conn), None)
+            self._cond.notify()
+
+    def acquire(
+        self,
+        key    : Hashable,
+        factory: Callable[[], "smtplib.SMTP"],
+        timeout: Optional[float] = None,
+    ) -> "smtplib.SMTP":
+        """
+        Lease a live connection for `key`, opening one with `factory` if needed.
+
+        Idle connections are checked with NOOP before being handed out; dead
+        ones are dropped and replaced. When `max_connections` are already
+        leased, blocks up to `timeout` seconds for one to be released or retired.
+
+        Raises:
+            ConnectError: If no connection frees up within `timeout`.
+        """
+        import smtplib
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                idle = self._idle.setdefault(key, deque())
+                self._open.setdefault(key, 0)
+                while not idle and self._open[key] >= self.max_connections:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise ConnectError(503,
+                            f"No pooled connection became available within {timeout}s."
+                        )
+                    self._cond.wait(remaining)
+                if idle:
+                    conn = idle.pop()
+                else:
+                    self._open[key] += 1
+                    conn = None
+
+            if conn is None:
+                return self._create(key, factory)
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPServerDisconnected, OSError):
+                pass
+            logger.info("Dropping dead pooled connection for %s", key)
+            self._discard(key, conn)
+
+    def _create(self, key: Hashable, factory: Callable[[], "smtplib.SMTP"]) -> "smtplib.SMTP":
+        try:
+            conn = factory()
+        except Exception:
+            with self._cond:
+                self._open[key] -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._counts[id(conn)] = 0
+        return conn
+
+    def _discard(self, key: Hashable, conn: "smtplib.SMTP") -> None:
+        try:
+            conn.quit()
+        except Exception:
+            pass
+        finally:
+            self._forget(key, conn)
+
+    def messages_sent(self, conn: "smtplib.SMTP") -> int:
+        """Messages sent on `conn` over its whole life, as reported to release()."""
+        with self._cond:
+            return self._counts.get(id(conn), 0)
+
+    def release(
+        self,
+        key      : Hashable,
+        conn     : "smtplib.SMTP",
+        msg_count: int  = 0,
+        retire   : bool = False,
+    ) -> None:
+        """
+        Return a leased connection, adding `msg_count` to its message tally.
+
+        Connections that have reached `max_messages`, or are released with
+        `retire=True`, are closed rather than pooled, so the server never
+        gets the chance to reset them mid-send.
+        """
+        with self._cond:
+            total = self._counts.get(id(conn), 0) + msg_count
+            self._counts[id(conn)] = total
+            if not retire and total < self.max_messages:
+                self._idle.setdefault(key, deque()).append(conn)
+                self._cond.notify()
+                return
+        logger.info("Retiring pooled connection for %s after %d messages", key, total)
+        self._discard(key, conn)
+
+    def close(self) -> None:
+        """Quit every idle connection in the pool."""
+        with self._cond:
+            idle = [(key, conn) for key, conns in self._idle.items() for conn in conns]
+            for conns in self._idle.values():
+                conns.clear()
+        for key, conn in idle:
+            self._discard(key, conn)
+
+    def __repr__(self) -> str:
+        with self._cond:
+            total = sum(self._open.values())
+        return f"SMTPConnectionPool(max_connections={self.max_connections}, open={total})"
@@ -4,7 +4,7 @@ Run with: pytest tests/ -v
 """
 import pytest
 from unittest.mock import MagicMock, patch
-from mailer_sdk import Mailer, AuthError, ConnectError, SendError, ValidationError
+from mailer_sdk import Mailer, BulkResult, AuthError, ConnectError, SendError, ValidationError
 
 
 # ── Init Tests ─────────────────────────────────────────────────
@@ -37,6 +37,11 @@ class TestMailerInit:
         m = Mailer(email="x@outlook.com", password="pass", provider="outlook")
         assert m.host == "smtp.office365.com"
 
+    def test_init_message_cap_defaults_per_provider(self):
+        assert Mailer(email="x@x.com", password="p").max_messages_per_connection == 4500
+        assert Mailer(email="x@x.com", password="p", provider="yahoo").max_messages_per_connection is None
+        assert Mailer(email="x@x.com", password="p", max_messages_per_connection=0).max_messages_per_connection == 0
+
     def test_repr_masks_email(self):
         m = Mailer(email="test@gmail.com", password="pass")
         assert "****" in repr(m)
@@ -59,6 +64,17 @@ class TestMailerConnect:
         mock_conn.starttls.assert_called_once()
         mock_conn.login.assert_called_once_with("test@gmail.com", "pass")
 
+    @patch("smtplib.SMTP")
+    def test_connect_reuses_ssl_context_and_sets_nodelay(self, mock_smtp):
+        import socket
+        Mailer(email="a@gmail.com", password="pass").connect()
+        Mailer(email="b@gmail.com", password="pass").connect()
+
+        mock_conn = mock_smtp.return_value
+        first, second = mock_conn.starttls.call_args_list
+        assert first[1]["context"] is second[1]["context"]
+        mock_conn.sock.setsockopt.assert_called_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     @patch("smtplib.SMTP")
     def test_connect_idempotent(self, mock_smtp):
         mock_conn = MagicMock()
@@ -89,6 +105,7 @@ class TestMailerSend:
     def _mailer_with_mock_conn(self):
         m = Mailer(email="test@gmail.com", password="pass")
         m._conn = MagicMock()
+        m._conn.noop.return_value = (250, b"OK")
         return m
 
     def test_send_plain_text(self):
@@ -113,6 +130,62 @@ class TestMailerSend:
         assert result["success"] is True
         assert len(result["to"]) == 2
 
+    def test_send_writes_cc_header(self):
+        m = self._mailer_with_mock_conn()
+        m.send(to="a@x.com", subject="Hi", body="Hello", cc=["boss@x.com", "team@x.com"])
+        _, rcpts, data = m._conn.sendmail.call_args[0][:3]
+        assert rcpts == ["a@x.com", "boss@x.com", "team@x.com"]
+        assert b"Cc: boss@x.com, team@x.com" in data
+
+    def test_send_keeps_bcc_off_the_headers(self):
+        m = self._mailer_with_mock_conn()
+        m.send(to="x@x.com", subject="Hi", body="Hello", bcc=["secret@x.com"])
+        _, rcpts, data = m._conn.sendmail.call_args[0][:3]
+        assert "secret@x.com" in rcpts
+        assert b"secret@x.com" not in data
+
+    def test_send_international_address_uses_smtputf8(self):
+        m = self._mailer_with_mock_conn()
+        m.send(to="jürgen@bücher.de", subject="Hi", body="Hello")
+        _, rcpts, data, options = m._conn.sendmail.call_args[0]
+        assert "To: jürgen@bücher.de".encode("utf-8") in data
+        assert "SMTPUTF8" in options
+
+    def test_send_attachment_round_trips(self, tmp_path):
+        import email
+        payload = bytes(range(256)) * 500
+        path = tmp_path / "blob.bin"
+        path.write_bytes(payload)
+
+        m = self._mailer_with_mock_conn()
+        m.send(to="x@x.com", subject="Hi", body="Hello", attachments=[str(path)])
+
+        sent = email.message_from_bytes(m._conn.sendmail.call_args[0][2])
+        part = sent.get_payload()[1]
+        assert part["Content-Transfer-Encoding"] == "base64"
+        assert part.get_filename() == "blob.bin"
+        assert part.get_payload(decode=True) == payload
+
+    def test_send_text_attachment_skips_base64(self, tmp_path):
+        import email
+        path = tmp_path / "report.csv"
+        path.write_text("name,city\nZoë,Kraków\n", encoding="utf-8")
+
+        m = self._mailer_with_mock_conn()
+        m.send(to="x@x.com", subject="Hi", body="Hello", attachments=[str(path)])
+        part = email.message_from_bytes(m._conn.sendmail.call_args[0][2]).get_payload()[1]
+        assert part["Content-Transfer-Encoding"] == "base64"   # no 8BITMIME advertised
+
+        m._conn.esmtp_features = {"8bitmime": ""}
+        m.send(to="x@x.com", subject="Hi", body="Hello", attachments=[str(path)])
+        data = m._conn.sendmail.call_args[0][2]
+        part = email.message_from_bytes(data).get_payload()[1]
+        assert part["Content-Transfer-Encoding"] == "8bit"
+        assert part.get_content_type() == "text/csv"
+        assert part.get_filename() == "report.csv"
+        assert "Zoë,Kraków".encode("utf-8") in data
+        assert m._conn.sendmail.call_args[0][3] == ["BODY=8BITMIME"]
+
     def test_send_bulk(self):
         m = self._mailer_with_mock_conn()
         result = m.send_bulk(
@@ -122,6 +195,253 @@ class TestMailerSend:
         assert result["sent"]  == 3
         assert result["total"] == 3
 
+    @patch("smtplib.SMTP")
+    def test_send_bulk_empty_does_not_connect(self, mock_smtp):
+        m = Mailer(email="test@gmail.com", password="pass")
+        assert m.send_bulk([], "Hi", "Hello")["total"] == 0
+        assert m.send_bulk_batched([], "Hi", "Hello")["batches"] == 0
+        mock_smtp.assert_not_called()
+
+    def test_send_bulk_result_is_compact(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = [{}, Exception("Mailbox full"), {}]
+        result = m.send_bulk(["a@x.com", "b@x.com", "c@x.com"], "Hi", "Hello")
+
+        assert result.success == bytearray(b"\x01\x00\x01")
+        assert result.errors  == {1: "Mailbox full"}
+        assert dict(result) == {
+            "sent": 2, "failed": 1, "total": 3,
+            "details": [
+                {"to": "a@x.com", "success": True},
+                {"to": "b@x.com", "success": False, "error": "Mailbox full"},
+                {"to": "c@x.com", "success": True},
+            ],
+        }
+
+    @patch("smtplib.SMTP")
+    def test_send_bulk_reconnects_at_message_cap(self, mock_smtp):
+        fresh = MagicMock()
+        mock_smtp.return_value = fresh
+        m = self._mailer_with_mock_conn()
+        m.max_messages_per_connection = 2
+        first = m._conn
+
+        result = m.send_bulk([f"u{i}@x.com" for i in range(5)], "Hi", "Hello")
+        assert result["sent"] == 5
+        assert first.sendmail.call_count == 2
+        first.quit.assert_called_once()
+        assert fresh.sendmail.call_count == 3
+        assert mock_smtp.call_count == 2
+
+    def test_send_bulk_reuses_one_session(self):
+        m = self._mailer_with_mock_conn()
+        conn = m._conn
+        with patch("smtplib.SMTP") as mock_smtp:
+            m.send_bulk(["a@x.com", "b@x.com", "c@x.com"], "Hi", "Hello")
+        mock_smtp.assert_not_called()
+        assert conn.sendmail.call_count == 3
+        assert conn.sendmail.call_args_list[0][0][1] == ["a@x.com"]
+
+    @patch("smtplib.SMTP")
+    def test_send_bulk_reconnects_stale_session(self, mock_smtp):
+        fresh = MagicMock()
+        mock_smtp.return_value = fresh
+        m = self._mailer_with_mock_conn()
+        m._conn.noop.return_value = (421, b"Timeout")
+
+        result = m.send_bulk(["a@x.com", "b@x.com"], "Hi", "Hello")
+        assert result["sent"] == 2
+        assert fresh.sendmail.call_count == 2
+
+    def test_send_bulk_prebuilt_message(self):
+        import email
+        m = self._mailer_with_mock_conn()
+        m.send_bulk(["a@x.com", "b@x.com"], "Café news", "Hello\nthere")
+
+        first, second = [c[0][2] for c in m._conn.sendmail.call_args_list]
+        sent = email.message_from_bytes(second)
+        assert sent["To"] == "b@x.com"
+        assert str(email.header.make_header(email.header.decode_header(sent["Subject"]))) == "Café news"
+        assert sent.get_payload() == "Hello\r\nthere\r\n"
+        assert email.message_from_bytes(first)["Message-ID"] != sent["Message-ID"]
+
+    def test_send_bulk_non_ascii_body_without_8bitmime_uses_mime(self):
+        m = self._mailer_with_mock_conn()
+        m.send_bulk(["a@x.com"], "Hi", "Grüße")
+        assert m._conn.sendmail.call_args[0][2].isascii()
+
+        m._conn.esmtp_features = {"8bitmime": ""}
+        m.send_bulk(["a@x.com"], "Hi", "Grüße")
+        assert "Grüße".encode("utf-8") in m._conn.sendmail.call_args[0][2]
+
+    def test_send_bulk_passes_eight_bit_to_builder(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.esmtp_features = {"8bitmime": "", "smtputf8": ""}
+        with patch.object(Mailer, "_build_message", autospec=True,
+                          return_value=([], b"data")) as build:
+            m.send_bulk(["jürgen@bücher.de"], "Hi", "Hello")
+        assert build.call_args[1]["eight_bit"] is True
+
+    def test_send_bulk_pipelines_when_advertised(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.esmtp_features = {"pipelining": ""}
+        m._conn.getreply.side_effect = [
+            (250, b"OK"), (250, b"OK"), (354, b"Go ahead"), (250, b"Queued"),
+        ] * 2
+
+        result = m.send_bulk(["a@x.com", "b@x.com"], "Hi", "Hello\n.dot")
+        assert result["sent"] == 2
+        m._conn.sendmail.assert_not_called()
+
+        commands, payload = [c[0][0] for c in m._conn.send.call_args_list[:2]]
+        assert commands == "MAIL FROM:<test@gmail.com>\r\nRCPT TO:<a@x.com>\r\nDATA\r\n"
+        assert b"\r\n..dot" in payload
+        assert payload.endswith(b"\r\n.\r\n")
+
+    def test_send_bulk_pipelining_rejected_recipient(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.esmtp_features = {"pipelining": ""}
+        m._conn.getreply.side_effect = [
+            (250, b"OK"), (550, b"No such user"), (503, b"No valid recipients"),
+        ]
+
+        result = m.send_bulk(["bad@x.com"], "Hi", "Hello")
+        assert result["failed"] == 1
+        m._conn.rset.assert_called_once()
+
+    def test_send_bulk_pipelining_data_rejection_is_not_resent(self):
+        import smtplib
+        m = self._mailer_with_mock_conn()
+        m._conn.esmtp_features = {"pipelining": "", "size": "35882577"}
+        m._conn.getreply.side_effect = [
+            (250, b"OK"), (250, b"OK"), (354, b"Go ahead"), (554, b"Rejected as spam"),
+        ]
+        m._conn.rset.side_effect = smtplib.SMTPServerDisconnected("gone")
+
+        result = m.send_bulk(["a@x.com"], "Hi", "Hello")
+        assert "554" in result["details"][0]["error"]
+        assert m._conn.send.call_count == 2       # commands + payload, once
+        assert " SIZE=" in m._conn.send.call_args_list[0][0][0]
+
+    def test_send_bulk_pipelining_421_closes_connection(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.esmtp_features = {"pipelining": ""}
+        m._conn.getreply.side_effect = [(421, b"Service not available")]
+
+        result = m.send_bulk(["a@x.com"], "Hi", "Hello")
+        assert "421" in result["details"][0]["error"]
+        m._conn.close.assert_called_once()
+        m._conn.rset.assert_not_called()
+
+    @patch("smtplib.SMTP")
+    def test_send_bulk_validates_before_connecting(self, mock_smtp):
+        m = Mailer(email="test@gmail.com", password="pass")
+        with pytest.raises(ValidationError) as exc:
+            m.send_bulk(["a@x.com", "", "not-an-email", "b@x.com"], "Hi", "Hello")
+        assert "not-an-email" in exc.value.message
+        mock_smtp.assert_not_called()
+
+    def test_send_bulk_bcc_single_transaction(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.return_value = {}
+        result = m.send_bulk(["a@x.com", "b@x.com", "c@x.com"], "Hi", "Hello", mode="bcc")
+
+        assert result["sent"] == 3
+        m._conn.sendmail.assert_called_once()
+        args = m._conn.sendmail.call_args[0]
+        assert args[1] == ["a@x.com", "b@x.com", "c@x.com"]
+        assert b"a@x.com" not in args[2]    # addresses stay off the headers
+
+    def test_send_bulk_bcc_retries_deferred_individually(self):
+        import smtplib
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = [
+            {"b@x.com": (452, b"Too many recipients")},
+            smtplib.SMTPRecipientsRefused({"b@x.com": (550, b"No such user")}),
+        ]
+        result = m.send_bulk(["a@x.com", "b@x.com"], "Hi", "Hello", mode="bcc")
+
+        assert result["sent"]   == 1
+        assert result["failed"] == 1
+        assert result["details"][1] == {"to": "b@x.com", "success": False, "error": "550 No such user"}
+
+    def test_send_bulk_bcc_does_not_retry_permanent_refusals(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.return_value = {"b@x.com": (550, b"No such user")}
+        result = m.send_bulk(["a@x.com", "b@x.com"], "Hi", "Hello", mode="bcc")
+
+        m._conn.sendmail.assert_called_once()
+        assert result["sent"] == 1
+        assert result["details"][1] == {"to": "b@x.com", "success": False, "error": "550 No such user"}
+
+    def test_send_bulk_result_to_dict(self):
+        import json
+        m = self._mailer_with_mock_conn()
+        result = m.send_bulk(["a@x.com"], "Hi", "Hello")
+
+        assert isinstance(result, BulkResult)
+        assert json.loads(json.dumps(result.to_dict())) == {
+            "sent": 1, "failed": 0, "total": 1, "details": [{"to": "a@x.com", "success": True}],
+        }
+
+    def test_send_bulk_logs_completion_once(self, caplog):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = [{"b@x.com": (452, b"Too many recipients")}, {}]
+        with caplog.at_level("INFO", logger="mailer_sdk"):
+            m.send_bulk(["a@x.com", "b@x.com"], "Hi", "Hello", mode="bcc")
+
+        done = [r.getMessage() for r in caplog.records if "Bulk send complete" in r.getMessage()]
+        assert done == ["Bulk send complete: 2/2 sent"]
+
+    def test_send_bulk_unknown_mode_raises(self):
+        m = self._mailer_with_mock_conn()
+        with pytest.raises(ValidationError):
+            m.send_bulk(["a@x.com"], "Hi", "Hello", mode="cc")
+
+    def test_send_bulk_batched(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.return_value = {}
+        recipients = [f"user{i}@x.com" for i in range(45)]
+        result = m.send_bulk_batched(recipients, "Hi", "Hello", batch_size=20)
+
+        assert result["sent"]    == 45
+        assert result["batches"] == 3
+        assert [len(c[0][1]) for c in m._conn.sendmail.call_args_list] == [20, 20, 5]
+        assert b"user0@x.com" not in m._conn.sendmail.call_args[0][2]
+
+    def test_send_bulk_batched_resends_deferred_recipients(self):
+        def sendmail(sender, rcpts, data, options):
+            return {r: (452, b"4.5.3 Too many recipients") for r in rcpts[2:]}
+
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = sendmail
+        recipients = ["a@x.com", "b@x.com", "c@x.com", "d@x.com"]
+        result = m.send_bulk_batched(recipients, "Hi", "Hello", batch_size=4)
+
+        assert result["sent"]    == 4
+        assert result["batches"] == 2
+        assert m._conn.sendmail.call_args[0][1] == ["c@x.com", "d@x.com"]
+
+    def test_send_bulk_batched_gives_up_when_nothing_is_delivered(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.return_value = {"b@x.com": (451, b"Try again later")}
+        result = m.send_bulk_batched(["a@x.com", "b@x.com"], "Hi", "Hello")
+
+        assert m._conn.sendmail.call_count == 2
+        assert result["details"][1] == {"to": "b@x.com", "success": False, "error": "451 Try again later"}
+
+    def test_send_bulk_batched_data_rejection_fails_batch(self):
+        import smtplib
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = [smtplib.SMTPDataError(552, b"Message too large"), {}]
+        recipients = ["a@x.com", "b@x.com", "c@x.com"]
+        result = m.send_bulk_batched(recipients, "Hi", "Hello", batch_size=2)
+
+        assert m._conn.sendmail.call_count == 2       # no bisecting on DATA errors
+        assert result["sent"] == 1
+        assert result["details"][0] == {"to": "a@x.com", "success": False, "error": "552 Message too large"}
+        assert result["details"][1]["error"] == "552 Message too large"
+
     def test_send_template(self):
         m = self._mailer_with_mock_conn()
         result = m.send_template(
@@ -131,11 +451,66 @@ class TestMailerSend:
         )
         assert result["success"] is True
 
+    def test_send_template_renders_placeholders(self):
+        m = self._mailer_with_mock_conn()
+        with patch.object(m, "send_html") as send_html:
+            m.send_template(
+                to="x@x.com", subject="Hi",
+                template="<style>p {color: red}</style>Hi {{name}}, {{missing}}",
+                context={"name": "Alice"}
+            )
+        body = send_html.call_args[0][2]
+        assert body == "<style>p {color: red}</style>Hi Alice, {{missing}}"
+
+    def test_send_template_accepts_any_non_brace_key(self):
+        m = self._mailer_with_mock_conn()
+        with patch.object(m, "send_html") as send_html:
+            m.send_template(
+                to="x@x.com", subject="Hi",
+                template="{{first-name}} #{{1}} {{名}} {{{name}}}",
+                context={"first-name": "Alice", 1: "one", "名": "太郎", "name": "Bob"}
+            )
+        assert send_html.call_args[0][2] == "Alice #one 太郎 {Bob}"
+
+    def test_send_bulk_template(self):
+        m = self._mailer_with_mock_conn()
+        result = m.send_bulk_template(
+            ["a@x.com", "b@x.com"], "Hi", "<p>Hi {{name}}</p>",
+            [{"name": "Alice"}, {"name": "Bob"}]
+        )
+        assert result["sent"] == 2
+        assert b"Bob" in m._conn.sendmail.call_args[0][2]
+
+    def test_send_bulk_template_bad_context_fails_only_that_recipient(self):
+        m = self._mailer_with_mock_conn()
+        result = m.send_bulk_template(
+            ["a@x.com", "b@x.com", "c@x.com"], "Hi", "<p>#{{n}}</p>",
+            [{"n": 1}, None, {"n": 3}]
+        )
+        assert result["sent"] == 2
+        assert m._conn.sendmail.call_count == 2
+        assert result["details"][1]["success"] is False
+
+    def test_send_bulk_template_context_mismatch_raises(self):
+        m = self._mailer_with_mock_conn()
+        with pytest.raises(ValidationError):
+            m.send_bulk_template(["a@x.com", "b@x.com"], "Hi", "{{name}}", [{}])
+
     def test_send_with_retry_succeeds(self):
         m = self._mailer_with_mock_conn()
         result = m.send_with_retry(to="x@x.com", subject="Hi", body="Hello")
         assert result["success"] is True
 
+    def test_send_with_retry_builds_message_once(self):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = [Exception("SMTP error"), {}]
+        with patch.object(m, "_build_message", wraps=m._build_message) as build:
+            result = m.send_with_retry(to="x@x.com", subject="Hi", body="Hello", backoff=0)
+        assert result["success"] is True
+        build.assert_called_once()
+        first, second = m._conn.sendmail.call_args_list
+        assert first[0][2] is second[0][2]
+
     def test_send_with_retry_exhausted(self):
         m = self._mailer_with_mock_conn()
         m._conn.sendmail.side_effect = Exception("SMTP error")
@@ -146,6 +521,76 @@ class TestMailerSend:
         assert result["success"] is False
         assert "retries" in result["error"]
 
+    @patch("time.sleep")
+    def test_send_with_retry_jittered_backoff(self, mock_sleep):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = Exception("SMTP error")
+        with patch("random.uniform", side_effect=lambda lo, hi: hi / 2) as uniform:
+            m.send_with_retry(to="x@x.com", subject="Hi", body="Hello", max_retries=3, backoff=1)
+
+        assert [c[0] for c in uniform.call_args_list] == [(0, 1), (0, 2)]
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("time.sleep")
+    def test_send_with_retry_respects_total_budget(self, mock_sleep):
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = Exception("SMTP error")
+        result = m.send_with_retry(
+            to="x@x.com", subject="Hi", body="Hello", max_retries=5, total_budget=0
+        )
+        assert result["success"] is False
+        assert "budget" in result["error"]
+        assert m._conn.sendmail.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_send_with_retry_stops_when_wait_reaches_deadline(self):
+        clock = [0.0]
+        def sleep(seconds):
+            clock[0] += seconds
+
+        m = self._mailer_with_mock_conn()
+        m._conn.sendmail.side_effect = Exception("SMTP error")
+        with patch("time.monotonic", lambda: clock[0]), patch("time.sleep", sleep), \
+             patch("random.uniform", return_value=10):
+            result = m.send_with_retry(
+                to="x@x.com", subject="Hi", body="Hello", max_retries=5, total_budget=3
+            )
+        assert "budget" in result["error"]
+        assert clock[0] == 3
+        assert m._conn.sendmail.call_count == 1
+
+
+# ── Prefetch Tests ─────────────────────────────────────────────
+class TestPrefetch:
+
+    def test_prefetch_preserves_order(self):
+        from mailer_sdk.mailer import _prefetch
+        assert list(_prefetch(iter(range(50)))) == list(range(50))
+
+    def test_prefetch_reraises_producer_error(self):
+        from mailer_sdk.mailer import _prefetch
+        def items():
+            yield 1
+            raise RuntimeError("boom")
+        with pytest.raises(RuntimeError):
+            list(_prefetch(items()))
+
+    def test_prefetch_reraises_producer_base_exception(self):
+        from mailer_sdk.mailer import _prefetch
+        def items():
+            yield 1
+            raise KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            list(_prefetch(items()))
+
+    def test_prefetch_stops_producer_when_abandoned(self):
+        import itertools, threading
+        from mailer_sdk.mailer import _prefetch
+        gen = _prefetch(itertools.count())
+        assert next(gen) == 0
+        gen.close()
+        assert not any(t.name == "mailer-sdk-prefetch" for t in threading.enumerate())
+
 
 # ── Context Manager Tests ──────────────────────────────────────
 class TestContextManager:
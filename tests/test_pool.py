@@ -0,0 +1,159 @@
+"""
+Unit tests for the SMTP connection pool.
+Run with: pytest tests/ -v
+"""
+import time
+import smtplib
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from mailer_sdk import Mailer, SMTPConnectionPool, ConnectError, ValidationError
+
+
+def _live_conn():
+    conn = MagicMock()
+    conn.noop.return_value = (250, b"OK")
+    return conn
+
+
+class TestSMTPConnectionPool:
+
+    def test_acquire_opens_then_reuses(self):
+        pool    = SMTPConnectionPool(max_connections=2)
+        factory = MagicMock(side_effect=_live_conn)
+
+        conn = pool.acquire("k", factory)
+        pool.release("k", conn, msg_count=1)
+        again = pool.acquire("k", factory)
+
+        assert again is conn
+        assert factory.call_count == 1
+
+    def test_dead_idle_connection_is_replaced(self):
+        pool    = SMTPConnectionPool()
+        dead    = MagicMock()
+        dead.noop.side_effect = smtplib.SMTPServerDisconnected()
+        fresh   = _live_conn()
+        factory = MagicMock(side_effect=[dead, fresh])
+
+        pool.release("k", pool.acquire("k", factory))
+        assert pool.acquire("k", factory) is fresh
+
+    def test_release_retires_after_max_messages(self):
+        pool = SMTPConnectionPool(max_messages=10)
+        conn = pool.acquire("k", _live_conn)
+        pool.release("k", conn, msg_count=10)
+
+        conn.quit.assert_called_once()
+        assert pool.acquire("k", _live_conn) is not conn
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool = SMTPConnectionPool(max_connections=1)
+        pool.acquire("k", _live_conn)
+        with pytest.raises(ConnectError):
+            pool.acquire("k", _live_conn, timeout=0.01)
+
+    def test_waiter_wakes_when_leased_connection_is_retired(self):
+        pool = SMTPConnectionPool(max_connections=1, max_messages=1)
+        conn = pool.acquire("k", _live_conn)
+        leased = []
+        waiter = threading.Thread(target=lambda: leased.append(pool.acquire("k", _live_conn, timeout=5)))
+
+        started = time.monotonic()
+        waiter.start()
+        time.sleep(0.05)
+        pool.release("k", conn, msg_count=1)     # retired, not returned
+        waiter.join()
+
+        assert leased and leased[0] is not conn
+        assert time.monotonic() - started < 1
+
+    def test_close_quits_idle_connections(self):
+        pool = SMTPConnectionPool()
+        conn = pool.acquire("k", _live_conn)
+        pool.release("k", conn)
+        pool.close()
+        conn.quit.assert_called_once()
+
+
+class TestMailerWithPool:
+
+    @patch("smtplib.SMTP")
+    def test_mailers_share_pooled_login(self, mock_smtp):
+        mock_smtp.return_value = _live_conn()
+        pool = SMTPConnectionPool()
+
+        for _ in range(3):
+            with Mailer(email="test@gmail.com", password="pass", pool=pool) as m:
+                m.send(to="x@x.com", subject="Hi", body="Hello")
+
+        assert mock_smtp.call_count == 1
+        mock_smtp.return_value.login.assert_called_once()
+        mock_smtp.return_value.quit.assert_not_called()
+
+    @patch("smtplib.SMTP")
+    def test_send_bulk_parallel_workers(self, mock_smtp):
+        mock_smtp.side_effect = lambda *a, **kw: _live_conn()
+        pool = SMTPConnectionPool(max_connections=3)
+        recipients = [f"user{i}@x.com" for i in range(7)]
+
+        with Mailer(email="test@gmail.com", password="pass", pool=pool) as m:
+            result = m.send_bulk(recipients, "Hi", "Hello", max_workers=8)
+
+        assert result["sent"] == 7
+        assert [r["to"] for r in result["details"]] == recipients
+        assert mock_smtp.call_count <= 3
+
+    @patch("smtplib.SMTP")
+    def test_message_cap_spans_leases(self, mock_smtp):
+        conns = []
+        mock_smtp.side_effect = lambda *a, **kw: conns.append(_live_conn()) or conns[-1]
+        pool = SMTPConnectionPool(max_messages=10)
+
+        for n in (8, 9):
+            with Mailer(email="test@gmail.com", password="pass", pool=pool,
+                        max_messages_per_connection=10) as m:
+                m.send_bulk([f"u{i}@x.com" for i in range(n)], "Hi", "Hello")
+
+        assert [c.sendmail.call_count for c in conns] == [10, 7]
+        conns[0].quit.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_pool_max_messages_applies_during_a_lease(self, mock_smtp):
+        conns = []
+        mock_smtp.side_effect = lambda *a, **kw: conns.append(_live_conn()) or conns[-1]
+        pool = SMTPConnectionPool(max_messages=10)
+
+        with Mailer(email="test@gmail.com", password="pass", pool=pool,
+                    max_messages_per_connection=0) as m:
+            result = m.send_bulk([f"u{i}@x.com" for i in range(25)], "Hi", "Hello")
+
+        assert result["sent"] == 25
+        assert [c.sendmail.call_count for c in conns] == [10, 10, 5]
+
+    @patch("smtplib.SMTP")
+    def test_connection_at_own_cap_is_not_reused(self, mock_smtp):
+        conns = []
+        mock_smtp.side_effect = lambda *a, **kw: conns.append(_live_conn()) or conns[-1]
+        pool = SMTPConnectionPool(max_messages=100)
+
+        with Mailer(email="test@gmail.com", password="pass", pool=pool,
+                    max_messages_per_connection=3) as m:
+            m.send_bulk(["a@x.com", "b@x.com", "c@x.com"], "Hi", "Hello")
+        with Mailer(email="test@gmail.com", password="pass", pool=pool) as m:
+            m.send(to="d@x.com", subject="Hi", body="Hello")
+
+        assert [c.sendmail.call_count for c in conns] == [3, 1]
+
+    @patch("smtplib.SMTP")
+    def test_send_bulk_parallel_empty(self, mock_smtp):
+        m = Mailer(email="test@gmail.com", password="pass", pool=SMTPConnectionPool())
+        result = m.send_bulk([], "Hi", "Hello", max_workers=2)
+
+        assert dict(result) == {"sent": 0, "failed": 0, "total": 0, "details": []}
+        mock_smtp.assert_not_called()
+
+    def test_send_bulk_parallel_requires_pool(self):
+        m = Mailer(email="test@gmail.com", password="pass")
+        with pytest.raises(ValidationError):
+            m.send_bulk(["a@x.com"], "Hi", "Hello", max_workers=2)